@@ -6,7 +6,6 @@ from urllib3.exceptions import MaxRetryError
 from kink import di
 from program.apis.trakt_api import TraktAPI
 from program.media.item import MediaItem
-from program.settings.manager import settings_manager
 from program.utils.request import BaseRequestHandler, Session, ResponseType, HttpMethod, ResponseObject, get_rate_limit_params, create_service_session
 
 class OverseerrAPIError(Exception):
@@ -122,10 +121,8 @@ class OverseerrAPI:
 
     def delete_request(self, mediaId: int) -> bool:
         """Delete request from `Overseerr`"""
-        settings = settings_manager.settings.content.overseerr
-        headers = {"X-Api-Key": settings.api_key}
         try:
-            response = self.request_handler.execute(HttpMethod.DELETE, f"api/v1/request/{mediaId}", headers=headers)
+            response = self.request_handler.execute(HttpMethod.DELETE, f"api/v1/request/{mediaId}")
             logger.debug(f"Deleted request {mediaId} from overseerr")
             return response.is_ok == True
         except Exception as e:
@@ -310,9 +310,7 @@ class TraktAPI:
             "redirect_uri": self.oauth_redirect_uri,
             "grant_type": "authorization_code",
         }
-        headers = self.headers.copy()
-        headers["trakt-api-key"] = api_key
-        response = self.request_handler.execute(HttpMethod.POST, token_url, data=payload, additional_headers=headers)
+        response = self.request_handler.execute(HttpMethod.POST, token_url, data=payload, headers={"trakt-api-key": api_key})
         if response.is_ok:
             token_data = response.data
             self.settings.access_token = token_data.get("access_token")
@@ -154,6 +154,13 @@ class MediaItem(db.Model):
             session.refresh(self, attribute_names=["blacklisted_streams"])
         return stream in self.blacklisted_streams
 
+    def get_blacklisted_stream_hashes(self) -> set[str]:
+        """Get the infohashes of all streams blacklisted for this item."""
+        session = object_session(self)
+        if session:
+            session.refresh(self, attribute_names=["blacklisted_streams"])
+        return {stream.infohash for stream in self.blacklisted_streams}
+
     def blacklist_active_stream(self):
         stream = next((stream for stream in self.streams if stream.infohash == self.active_stream.get("infohash", None)), None)
         if stream:
@@ -213,7 +220,8 @@ class MediaItem(db.Model):
         if session and session.is_active:
             try:
                 session.refresh(self, attribute_names=["blacklisted_streams"])
-                return (len(self.streams) > 0 and any(stream not in self.blacklisted_streams for stream in self.streams))
+                blacklisted_hashes = {stream.infohash for stream in self.blacklisted_streams}
+                return (len(self.streams) > 0 and any(stream.infohash not in blacklisted_hashes for stream in self.streams))
             except (sqlalchemy.exc.InvalidRequestError, sqlalchemy.orm.exc.DetachedInstanceError):
                 return False
         return False
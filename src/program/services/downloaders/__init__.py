@@ -42,10 +42,20 @@ class Downloader:
     def run(self, item: MediaItem):
         logger.debug(f"Running downloader for {item.log_string}")
 
-        for stream in item.streams:
+        blacklisted_hashes = item.get_blacklisted_stream_hashes()
+        streams = [stream for stream in item.streams if stream.infohash not in blacklisted_hashes]
+        try:
+            availability = self.get_instant_availability([stream.infohash for stream in streams])
+        except Exception as e:
+            # Don't blacklist every stream because of a failed lookup, try again on the next run
+            logger.warning(f"Failed to get instant availability for {item.log_string}: {e}")
+            yield item
+            return
+
+        for stream in streams:
             torrent_id = None
             try:
-                torrent_id = self.download_cached_stream(item, stream)
+                torrent_id = self.download_cached_stream(item, stream, availability.get(stream.infohash, []))
                 if torrent_id:
                     break
             except Exception as e:
@@ -55,14 +65,15 @@ class Downloader:
                 item.blacklist_stream(stream)
         yield item
 
-    def download_cached_stream(self, item: MediaItem, stream: Stream) -> bool:
+    def download_cached_stream(self, item: MediaItem, stream: Stream, cached_containers: list[dict] | None = None) -> bool:
         torrent_id = None
-        cached_containers = self.get_instant_availability([stream.infohash]).get(stream.infohash, None)
+        if cached_containers is None:
+            cached_containers = self.get_instant_availability([stream.infohash]).get(stream.infohash, None)
         if not cached_containers:
             raise Exception("Not cached!")
         the_container = cached_containers[0]
         torrent_id = self.add_torrent(stream.infohash)
-        info = self.get_torrent_info(torrent_id)
+        info = self.wait_for_files(torrent_id)
         self.select_files(torrent_id, the_container.keys())
         if not self.update_item_attributes(item, info, the_container):
             raise Exception("No matching files found!")
@@ -72,12 +83,25 @@ class Downloader:
     def get_instant_availability(self, infohashes: list[str]) -> dict[str, list[dict]]:
         return self.service.get_instant_availability(infohashes)
 
+    def get_cached_hashes(self, infohashes: list[str]) -> set[str]:
+        """Get the infohashes that have at least one cached container, without picking a container"""
+        try:
+            availability = self.get_instant_availability(infohashes)
+        except Exception as e:
+            # Report the streams as uncached rather than failing the caller
+            logger.warning(f"Failed to get instant availability: {e}")
+            return set()
+        return {infohash for infohash, containers in availability.items() if containers}
+
     def add_torrent(self, infohash: str) -> int:
         return self.service.add_torrent(infohash)
 
     def get_torrent_info(self, torrent_id: int):
         return self.service.get_torrent_info(torrent_id)
 
+    def wait_for_files(self, torrent_id: int):
+        return self.service.wait_for_files(torrent_id)
+
     def select_files(self, torrent_id, container):
         self.service.select_files(torrent_id, container)
 
@@ -89,31 +113,31 @@ class Downloader:
         found = False
         item = item
         container = container
-        for file in container.values():
-            if item.type == "movie" and self.service.file_finder.container_file_matches_movie(file):
-                item.file = file[self.service.file_finder.filename_attr]
-                item.folder = info["filename"]
-                item.alternative_folder = info["original_filename"]
-                item.active_stream = {"infohash": info["hash"], "id": info["id"]}
-                found = True
-                break
-            if item.type in ["show", "season", "episode"]:
-                show = item
-                if item.type == "season":
-                    show = item.parent
-                elif item.type == "episode":
-                    show = item.parent.parent
-                file_season, file_episodes = self.service.file_finder.container_file_matches_episode(file)
-                if file_season and file_episodes:
-                    season = next((season for season in show.seasons if season.number == file_season), None)
-                    for file_episode in file_episodes:
-                        episode = next((episode for episode in season.episodes if episode.number == file_episode), None)
-                        if episode and episode.state not in [States.Completed, States.Symlinked, States.Downloaded]:
-                            episode.file = file[self.service.file_finder.filename_attr]
-                            episode.folder = info["filename"]
-                            episode.alternative_folder = info["original_filename"]
-                            episode.active_stream = {"infohash": info["hash"], "id": info["id"]}
-                            # We have to make sure the episode is correct if item is an episode
-                            if item.type != "episode" or (item.type == "episode" and episode.number == item.number):
-                                found = True
-        return found
\ No newline at end of file
+        if item.type == "movie":
+            for file in container.values():
+                if self.service.file_finder.container_file_matches_movie(file):
+                    item.file = file[self.service.file_finder.filename_attr]
+                    item.folder = info["filename"]
+                    item.alternative_folder = info["original_filename"]
+                    item.active_stream = {"infohash": info["hash"], "id": info["id"]}
+                    found = True
+                    break
+        elif item.type in ["show", "season", "episode"]:
+            show = item
+            if item.type == "season":
+                show = item.parent
+            elif item.type == "episode":
+                show = item.parent.parent
+            files_by_episode = self.service.file_finder.group_by_episode(container)
+            for season in show.seasons:
+                for episode in season.episodes:
+                    file = files_by_episode.get((season.number, episode.number))
+                    if file and episode.state not in [States.Completed, States.Symlinked, States.Downloaded]:
+                        episode.file = file[self.service.file_finder.filename_attr]
+                        episode.folder = info["filename"]
+                        episode.alternative_folder = info["original_filename"]
+                        episode.active_stream = {"infohash": info["hash"], "id": info["id"]}
+                        # We have to make sure the episode is correct if item is an episode
+                        if item.type != "episode" or (item.type == "episode" and episode.number == item.number):
+                            found = True
+        return found
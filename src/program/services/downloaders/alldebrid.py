@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Iterator, List, Optional, Tuple
 
 from requests import Session
@@ -9,7 +9,7 @@ from program.utils.request import get_rate_limit_params, create_service_session,
 
 from program.settings.manager import settings_manager
 
-from .shared import VIDEO_EXTENSIONS, DownloaderBase, FileFinder, premium_days_left
+from .shared import VIDEO_SUFFIXES, DownloaderBase, FileFinder, premium_days_left
 
 
 class AllDebridError(Exception):
@@ -100,7 +100,7 @@ class AllDebridDownloader(DownloaderBase):
                 logger.error("Premium membership required")
                 return False
 
-            expiration = datetime.utcfromtimestamp(user.get("premiumUntil", 0))
+            expiration = datetime.fromtimestamp(user.get("premiumUntil", 0), tz=timezone.utc)
             logger.log("DEBRID", premium_days_left(expiration))
             return True
 
@@ -114,6 +114,9 @@ class AllDebridDownloader(DownloaderBase):
         """
         Get instant availability for multiple infohashes
         Required by DownloaderBase
+
+        Raises AllDebridError if the availability could not be fetched,
+        so a failed lookup isn't mistaken for uncached hashes.
         """
         if not self.initialized:
             logger.error("Downloader not properly initialized")
@@ -138,8 +141,7 @@ class AllDebridDownloader(DownloaderBase):
             return availability
 
         except Exception as e:
-            logger.error(f"Failed to get instant availability: {e}")
-            return {}
+            raise AllDebridError(f"Failed to get instant availability: {e}") from e
 
     def _walk_files(self, files: List[dict]) -> Iterator[Tuple[str, int]]:
         """Walks nested files structure and yields filename, size pairs"""
@@ -158,10 +160,8 @@ class AllDebridDownloader(DownloaderBase):
         """Process and filter valid video files"""
         result = {}
         for i, (name, size) in enumerate(self._walk_files(files)):
-            if (
-                any(name.lower().endswith(ext) for ext in VIDEO_EXTENSIONS)
-                and "sample" not in name.lower()
-            ):
+            lowercase_name = name.lower()
+            if lowercase_name.endswith(VIDEO_SUFFIXES) and "sample" not in lowercase_name:
                 result[str(i)] = {"filename": name, "filesize": size}
         return result
 
@@ -1,7 +1,9 @@
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from requests import Session
 from loguru import logger
@@ -9,9 +11,9 @@ from pydantic import BaseModel
 
 from program.settings.manager import settings_manager
 
-from .shared import VIDEO_EXTENSIONS, DownloaderBase, FileFinder, premium_days_left
+from .shared import VIDEO_SUFFIXES, DownloaderBase, FileFinder, premium_days_left
 from program.utils.request import get_rate_limit_params, create_service_session, BaseRequestHandler, HttpMethod, \
-    ResponseType
+    RateLimitExceeded, ResponseType
 
 
 class RDTorrentStatus(str, Enum):
@@ -44,17 +46,41 @@ class RealDebridError(Exception):
     """Base exception for Real-Debrid related errors"""
 
 class RealDebridRequestHandler(BaseRequestHandler):
+    MAX_CONCURRENT_REQUESTS = 8
+    MAX_RATE_LIMIT_RETRIES = 2
+    MAX_RETRY_AFTER = 10.0
+
     def __init__(self, session: Session, base_url: str, request_logging: bool = False):
         super().__init__(session, response_type=ResponseType.DICT, base_url=base_url, custom_exception=RealDebridError, request_logging=request_logging)
+        self._semaphore = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
 
     def execute(self, method: HttpMethod, endpoint: str, **kwargs) -> Union[dict, list]:
-        response = super()._request(method, endpoint, **kwargs)
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                with self._semaphore:
+                    response = super()._request(method, endpoint, **kwargs)
+                break
+            except RateLimitExceeded as e:
+                if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    raise
+                retry_after = self._get_retry_after(e.response)
+                logger.debug(f"Real-Debrid rate limit hit, retrying in {retry_after}s (attempt {attempt + 1}/{self.MAX_RATE_LIMIT_RETRIES})")
+                time.sleep(retry_after)
+
         if response.status_code == 204:
             return {}
         if not response.data and not response.is_ok:
             raise RealDebridError("Invalid JSON response from RealDebrid")
         return response.data
 
+    def _get_retry_after(self, response) -> float:
+        """Get the delay requested by the Retry-After header, capped to keep workers from stalling"""
+        try:
+            retry_after = float(response.headers.get("Retry-After", 1))
+        except (AttributeError, TypeError, ValueError):
+            retry_after = 1.0
+        return min(max(retry_after, 0.0), self.MAX_RETRY_AFTER)
+
 class RealDebridAPI:
     """Handles Real-Debrid API communication"""
     BASE_URL = "https://api.real-debrid.com/rest/1.0"
@@ -72,12 +98,18 @@ class RealDebridDownloader(DownloaderBase):
     """Main Real-Debrid downloader class implementing DownloaderBase"""
     MAX_RETRIES = 3
     RETRY_DELAY = 1.0
+    MAX_HASHES_PER_REQUEST = 40
+    MAGNET_CONVERSION_POLLS = 10
+    MAGNET_CONVERSION_POLL_INTERVAL = 0.1
+    AVAILABILITY_CACHE_TTL = 30
 
     def __init__(self):
         self.key = "realdebrid"
         self.settings = settings_manager.settings.downloaders.real_debrid
         self.api = None
         self.file_finder = None
+        self._availability_cache: Dict[str, Tuple[float, Optional[list]]] = {}
+        self._availability_cache_lock = threading.Lock()
         self.initialized = self.validate()
 
     def validate(self) -> bool:
@@ -116,9 +148,7 @@ class RealDebridDownloader(DownloaderBase):
                 logger.error("Premium membership required")
                 return False
 
-            expiration = datetime.fromisoformat(
-                user_info["expiration"].replace("Z", "+00:00")
-            ).replace(tzinfo=None)
+            expiration = datetime.fromisoformat(user_info["expiration"].replace("Z", "+00:00"))
             logger.info(premium_days_left(expiration))
             return True
         except Exception as e:
@@ -127,13 +157,51 @@ class RealDebridDownloader(DownloaderBase):
 
     def get_instant_availability(self, infohashes: List[str]) -> Dict[str, list]:
         """
-        Get instant availability for multiple infohashes with retry logic
+        Get instant availability for multiple infohashes
         Required by DownloaderBase
+
+        Raises RealDebridError if the availability could not be fetched,
+        so a failed lookup isn't mistaken for uncached hashes.
         """
 
         if len(infohashes) == 0:
             return {}
 
+        # Serve hashes probed within the last few seconds from cache,
+        # shows tend to look up the same season packs for every episode
+        availability: Dict[str, list] = {}
+        missing_infohashes = []
+        with self._availability_cache_lock:
+            now = time.monotonic()
+            expired_infohashes = [
+                infohash for infohash, (cached_at, _) in self._availability_cache.items()
+                if now - cached_at >= self.AVAILABILITY_CACHE_TTL
+            ]
+            for infohash in expired_infohashes:
+                del self._availability_cache[infohash]
+            for infohash in dict.fromkeys(infohashes):
+                if infohash not in self._availability_cache:
+                    missing_infohashes.append(infohash)
+                elif (containers := self._availability_cache[infohash][1]) is not None:
+                    availability[infohash] = containers
+
+        chunks = [
+            missing_infohashes[i:i + self.MAX_HASHES_PER_REQUEST]
+            for i in range(0, len(missing_infohashes), self.MAX_HASHES_PER_REQUEST)
+        ]
+        if not chunks:
+            return availability
+        if len(chunks) == 1:
+            availability.update(self._get_instant_availability_chunk(chunks[0]))
+            return availability
+
+        with ThreadPoolExecutor(max_workers=min(len(chunks), RealDebridRequestHandler.MAX_CONCURRENT_REQUESTS), thread_name_prefix="RealDebridAvailability") as executor:
+            for result in executor.map(self._get_instant_availability_chunk, chunks):
+                availability.update(result)
+        return availability
+
+    def _get_instant_availability_chunk(self, infohashes: List[str]) -> Dict[str, list]:
+        """Get instant availability for a single batch of infohashes with retry logic"""
         for attempt in range(self.MAX_RETRIES):
             try:
                 response = self.api.request_handler.execute(
@@ -145,26 +213,36 @@ class RealDebridDownloader(DownloaderBase):
                 if not isinstance(response, dict):
                     return {}
 
-                # Check for empty response
+                # None of the hashes are cached, remember them as misses
                 if all(isinstance(data, list) for data in response.values()):
-                    logger.debug(f"Empty response received (attempt {attempt + 1}/{self.MAX_RETRIES})")
-                    time.sleep(self.RETRY_DELAY)
-                    continue
+                    self._cache_availability(infohashes, {})
+                    return {}
 
-                return {
+                availability = {
                     infohash: self._filter_valid_containers(data.get("rd", []))
                     for infohash, data in response.items()
                     if isinstance(data, dict) and "rd" in data
                 }
+                self._cache_availability(infohashes, availability)
+                return availability
 
+            except RateLimitExceeded:
+                # The request handler already retried after the rate limit, don't pile more requests on top
+                raise
             except Exception as e:
                 logger.debug(f"Failed to get instant availability (attempt {attempt + 1}/{self.MAX_RETRIES}): {e}")
                 if attempt < self.MAX_RETRIES - 1:
                     time.sleep(self.RETRY_DELAY)
                 continue
 
-        logger.debug("All retry attempts failed for instant availability")
-        return {}
+        raise RealDebridError("All retry attempts failed for instant availability")
+
+    def _cache_availability(self, infohashes: List[str], availability: Dict[str, list]):
+        """Remember the availability of the probed infohashes, hashes missing from `availability` are cached as misses"""
+        with self._availability_cache_lock:
+            now = time.monotonic()
+            for infohash in infohashes:
+                self._availability_cache[infohash] = (now, availability.get(infohash))
 
     def _filter_valid_containers(self, containers: List[dict]) -> List[dict]:
         """Filter and sort valid video containers"""
@@ -177,10 +255,7 @@ class RealDebridDownloader(DownloaderBase):
     def _contains_valid_video_files(self, container: dict) -> bool:
         """Check if container has valid video files"""
         return all(
-            any(
-                file["filename"].endswith(ext) and "sample" not in file["filename"].lower()
-                for ext in VIDEO_EXTENSIONS
-            )
+            file["filename"].endswith(VIDEO_SUFFIXES) and "sample" not in file["filename"].lower()
             for file in container.values()
         )
 
@@ -236,6 +311,18 @@ class RealDebridDownloader(DownloaderBase):
             logger.error(f"Failed to get torrent info for {torrent_id}: {e}")
             raise
 
+    def wait_for_files(self, torrent_id: str) -> dict:
+        """Get the torrent info, waiting for a freshly added magnet to finish converting"""
+        info = self.get_torrent_info(torrent_id)
+        # Freshly added magnets are briefly in conversion before their files are known,
+        # poll in short intervals instead of waiting a fixed amount of time
+        for _ in range(self.MAGNET_CONVERSION_POLLS):
+            if info.get("status") != RDTorrentStatus.MAGNET_CONVERSION:
+                break
+            time.sleep(self.MAGNET_CONVERSION_POLL_INTERVAL)
+            info = self.get_torrent_info(torrent_id)
+        return info
+
     def delete_torrent(self, torrent_id: str):
         """
         Delete a torrent
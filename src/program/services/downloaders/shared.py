@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 
 from loguru import logger
 from RTN import parse
@@ -30,6 +30,8 @@ VIDEO_EXTENSIONS = [ext for ext in VIDEO_EXTENSIONS if ext in ALLOWED_VIDEO_EXTE
 if not VIDEO_EXTENSIONS:
     VIDEO_EXTENSIONS = DEFAULT_VIDEO_EXTENSIONS
 
+VIDEO_SUFFIXES = tuple(VIDEO_EXTENSIONS)
+
 # Type aliases
 InfoHash = str  # A torrent hash
 DebridTorrentId = (
@@ -65,6 +67,10 @@ class DownloaderBase(ABC):
     def delete_torrent():
         pass
 
+    def wait_for_files(self, torrent_id):
+        """Get the torrent info once its files are known, services that need time to resolve them override this"""
+        return self.get_torrent_info(torrent_id)
+
 class FileFinder:
     """
     A class that helps you find files.
@@ -107,6 +113,17 @@ class FileFinder:
         except Exception:
             return None, None
 
+    def group_by_episode(self, container: dict) -> dict[tuple[int, int], dict]:
+        """Parse each file in a container once and map every (season, episode) it covers to the file"""
+        files_by_episode = {}
+        for file in container.values():
+            file_season, file_episodes = self.container_file_matches_episode(file)
+            if not file_season or not file_episodes:
+                continue
+            for file_episode in file_episodes:
+                files_by_episode[(file_season, file_episode)] = file
+        return files_by_episode
+
     def container_file_matches_movie(self, file):
         filename = file[self.filename_attr]
         try:
@@ -140,9 +157,12 @@ class FileFinder:
 
 def premium_days_left(expiration: datetime) -> str:
     """Convert an expiration date into a message showing days remaining on the user's premium account"""
-    time_left = expiration - datetime.utcnow()
-    days_left = time_left.days
-    hours_left, minutes_left = divmod(time_left.seconds // 3600, 60)
+    if expiration.tzinfo is None:
+        expiration = expiration.replace(tzinfo=timezone.utc)
+    seconds_left = max(0, int((expiration - datetime.now(timezone.utc)).total_seconds()))
+    days_left, seconds_left = divmod(seconds_left, 86400)
+    hours_left, seconds_left = divmod(seconds_left, 3600)
+    minutes_left = seconds_left // 60
     expiration_message = ""
 
     if days_left > 0:
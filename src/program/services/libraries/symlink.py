@@ -89,11 +89,11 @@ class SymlinkLibrary:
 def process_items(directory: Path, item_class, item_type: str, is_anime: bool = False):
     """Process items in the given directory and yield MediaItem instances."""
     items = [
-        (Path(root), file)
+        (root_path, file)
         for root, _, files in os.walk(directory)
+        if (root_path := Path(root)).parent in POSSIBLE_DIRS # MacOS creates extra dirs
         for file in files
         if os.path.splitext(file)[1][1:] in ALLOWED_VIDEO_EXTENSIONS # Jellyfin/Emby creates extra files
-        and Path(root).parent in POSSIBLE_DIRS # MacOS creates extra dirs
     ]
     for path, filename in items:
         if path.parent not in POSSIBLE_DIRS:
@@ -128,8 +128,9 @@ def resolve_symlink_and_set_attrs(item, path: Path) -> Path:
 
 def find_subtitles(item, path: Path):
     # Scan for subtitle files
+    symlink_stem = Path(item.symlink_path).stem
     for file in os.listdir(path.parent):
-        if file.startswith(Path(item.symlink_path).stem) and file.endswith(".srt"):
+        if file.startswith(symlink_stem) and file.endswith(".srt"):
             lang_code = file.split(".")[1]
             item.subtitles.append(Subtitle({lang_code: (path.parent / file).__str__()}))
             logger.debug(f"Found subtitle file {file}.")
@@ -1,6 +1,6 @@
-import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Generator, List, Union
+from typing import Dict, Generator, Union
 
 from loguru import logger
 
@@ -60,32 +60,29 @@ class Scraping:
 
     def scrape(self, item: MediaItem, log = True) -> Dict[str, Stream]:
         """Scrape an item."""
-        threads: List[threading.Thread] = []
         results: Dict[str, str] = {}
         total_results = 0
-        results_lock = threading.RLock()
+        services = [service for service in self.services.values() if service.initialized]
+        if not services:
+            return {}
+
+        with ThreadPoolExecutor(thread_name_prefix="Scraping", max_workers=len(services)) as executor:
+            futures = {executor.submit(service.run, item): service for service in services}
+            for future in as_completed(futures):
+                service = futures[future]
+                try:
+                    service_results = future.result()
+                except Exception as e:
+                    logger.error(f"Service {service.__class__.__name__} failed to scrape {item.log_string}: {e}")
+                    continue
+
+                if not isinstance(service_results, dict):
+                    logger.error(f"Service {service.__class__.__name__} returned invalid results: {service_results}")
+                    continue
 
-        def run_service(service, item,):
-            nonlocal total_results
-            service_results = service.run(item)
-
-            if not isinstance(service_results, dict):
-                logger.error(f"Service {service.__class__.__name__} returned invalid results: {service_results}")
-                return
-
-            with results_lock:
                 results.update(service_results)
                 total_results += len(service_results)
 
-        for service_name, service in self.services.items():
-            if service.initialized:
-                thread = threading.Thread(target=run_service, args=(service, item), name=service_name.__name__)
-                threads.append(thread)
-                thread.start()
-
-        for thread in threads:
-            thread.join()
-
         if total_results != len(results):
             logger.debug(f"Scraped {item.log_string} with {total_results} results, removed {total_results - len(results)} duplicate hashes")
 
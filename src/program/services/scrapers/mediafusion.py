@@ -1,5 +1,6 @@
 """ Mediafusion scraper module """
 import json
+import re
 from typing import Dict
 
 from loguru import logger
@@ -12,6 +13,10 @@ from program.settings.manager import settings_manager
 from program.settings.models import AppModel
 from program.utils.request import create_service_session, get_rate_limit_params, RateLimitExceeded, HttpMethod, ResponseType
 
+# The raw title is the first part of the description, e.g. "📂 Title\n💾 1.2 GB ..."
+TITLE_PATTERN = re.compile(r"^(?:📂 )?(.*?)\n💾", re.DOTALL)
+INFO_HASH_PATTERN = re.compile(r"[?&]info_hash=([^&#]+)")
+
 
 class Mediafusion:
     """Scraper for `Mediafusion`"""
@@ -45,6 +50,9 @@ class Mediafusion:
         if not isinstance(self.settings.ratelimit, bool):
             logger.error("Mediafusion ratelimit must be a valid boolean.")
             return False
+        if not isinstance(self.settings.max_streams, int) or self.settings.max_streams <= 0:
+            logger.error("Mediafusion max streams is not set or invalid.")
+            return False
         if not self.settings.catalogs:
             logger.error("Configure at least one Mediafusion catalog.")
             return False
@@ -76,10 +84,9 @@ class Mediafusion:
         }
 
         url = f"{self.settings.url}/encrypt-user-data"
-        headers = {"Content-Type": "application/json"}
 
         try:
-            response = self.request_handler.execute(HttpMethod.POST, url, overriden_response_type=ResponseType.DICT, json=payload, headers=headers)
+            response = self.request_handler.execute(HttpMethod.POST, url, overriden_response_type=ResponseType.DICT, json=payload)
             self.encrypted_string = json.loads(response.data)["encrypted_str"]
         except Exception as e:
             logger.error(f"Failed to encrypt user data: {e}")
@@ -121,30 +128,36 @@ class Mediafusion:
         if identifier:
             url += identifier
 
-        response = self.request_handler.execute(HttpMethod.GET, f"{url}.json", timeout=self.timeout)
+        response = self.request_handler.execute(HttpMethod.GET, f"{url}.json", overriden_response_type=ResponseType.DICT, timeout=self.timeout)
 
-        if not response.is_ok or len(response.data.streams) <= 0:
+        if not response.is_ok or not response.data.get("streams"):
             return {}
 
         torrents: Dict[str, str] = {}
 
-        for stream in response.data.streams:
-            description_split = stream.description.split("\n💾")
-            if len(description_split) < 2:
-                logger.warning(f"Invalid stream description: {stream.description}")
+        for stream in response.data["streams"]:
+            # Streams are ranked again after scraping, there is no need to parse the long tail
+            if len(torrents) >= self.settings.max_streams:
+                logger.debug(f"Mediafusion returned more than {self.settings.max_streams} streams for {item.log_string}, ignoring the rest")
+                break
+
+            description = stream.get("description") or ""
+            title_match = TITLE_PATTERN.match(description)
+            if not title_match:
+                logger.warning(f"Invalid stream description: {description}")
                 continue
-            raw_title = description_split[0].replace("📂 ", "")
-            
-            url_split = stream.url.split("?info_hash=")
-            if len(url_split) < 2:
-                logger.warning(f"Invalid stream URL: {stream.url}")
+
+            stream_url = stream.get("url") or ""
+            info_hash_match = INFO_HASH_PATTERN.search(stream_url)
+            if not info_hash_match:
+                logger.warning(f"Invalid stream URL: {stream_url}")
                 continue
-            info_hash = url_split[1]
 
-            if not info_hash or not raw_title:
+            raw_title = title_match.group(1)
+            if not raw_title:
                 continue
 
-            torrents[info_hash] = raw_title
+            torrents[info_hash_match.group(1)] = raw_title
 
         if torrents:
             logger.log("SCRAPER", f"Found {len(torrents)} streams for {item.log_string}")
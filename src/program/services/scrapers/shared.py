@@ -46,6 +46,8 @@ def _parse_results(item: MediaItem, results: Dict[str, str], log_msg: bool = Tru
     torrents: Set[Torrent] = set()
     processed_infohashes: Set[str] = set()
     correct_title: str = item.get_top_title()
+    aliases: dict = item.get_aliases() if enable_aliases else {}  # in some cases we want to disable aliases
+    remove_trash: bool = settings_manager.settings.ranking.options["remove_all_trash"]
 
     logger.log("SCRAPER", f"Processing {len(results)} results for {item.log_string}")
 
@@ -61,8 +63,8 @@ def _parse_results(item: MediaItem, results: Dict[str, str], log_msg: bool = Tru
                 raw_title=raw_title,
                 infohash=infohash,
                 correct_title=correct_title,
-                remove_trash=settings_manager.settings.ranking.options["remove_all_trash"],
-                aliases=item.get_aliases() if enable_aliases else {}  # in some cases we want to disable aliases
+                remove_trash=remove_trash,
+                aliases=aliases
             )
 
 
@@ -7,7 +7,7 @@ from requests.exceptions import ConnectTimeout
 from program.media.item import MediaItem
 from program.services.scrapers.shared import ScraperRequestHandler
 from program.settings.manager import settings_manager
-from program.utils.request import create_service_session, RateLimitExceeded, HttpMethod
+from program.utils.request import create_service_session, RateLimitExceeded, HttpMethod, ResponseType
 
 
 class TorBoxScraper:
@@ -71,14 +71,14 @@ class TorBoxScraper:
         query_params = self._build_query_params(item)
         url = f"{self.base_url}/torrents/{query_params}?metadata=false"
 
-        response = self.request_handler.execute(HttpMethod.GET, url, timeout=self.timeout)
-        if not response.is_ok or not response.data.data.torrents:
+        response = self.request_handler.execute(HttpMethod.GET, url, overriden_response_type=ResponseType.DICT, timeout=self.timeout)
+        if not response.is_ok or not (response.data.get("data") or {}).get("torrents"):
             return {}
 
         torrents = {}
-        for torrent_data in response.data.data.torrents:
-            raw_title = torrent_data.raw_title
-            info_hash = torrent_data.hash
+        for torrent_data in response.data["data"]["torrents"]:
+            raw_title = torrent_data.get("raw_title")
+            info_hash = torrent_data.get("hash")
             if not info_hash or not raw_title:
                 continue
 
@@ -233,6 +233,7 @@ class MediafusionConfig(Observable):
     url: str = "https://mediafusion.elfhosted.com"
     timeout: int = 30
     ratelimit: bool = True
+    max_streams: int = 200
     catalogs: List[str] = [
         "prowlarr_streams",
         "torrentio_streams",
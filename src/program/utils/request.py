@@ -3,6 +3,8 @@ from enum import Enum
 from types import SimpleNamespace
 from typing import Dict, Type, Optional, Any
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from lxml import etree
 from requests.exceptions import ConnectTimeout, RequestException, HTTPError
 from requests.models import Response
@@ -15,6 +17,10 @@ from pyrate_limiter import RequestRate, Duration, Limiter, MemoryQueueBucket, Me
 from requests_ratelimiter import SQLiteBucket
 
 
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+
+
 class HttpMethod(Enum):
     GET = "GET"
     POST = "POST"
@@ -94,7 +100,11 @@ class BaseRequestHandler:
         self.request_logging = request_logging
 
     def _request(self, method: HttpMethod, endpoint: str, ignore_base_url: Optional[bool] = None, overriden_response_type: ResponseType = None, **kwargs) -> ResponseObject:
-        """Generic request handler with error handling, using kwargs for flexibility."""
+        """
+        Generic request handler with error handling, using kwargs for flexibility.
+
+        Headers and proxies shared by every call belong on the session, per-call `headers` are merged over them.
+        """
         try:
             url = f"{self.BASE_URL}/{endpoint}".rstrip('/') if not ignore_base_url and self.BASE_URL else endpoint
 
@@ -160,14 +170,29 @@ def create_service_session(
             logger.debug(f"Rate Limit Parameters: {rate_limit_params}")
             logger.debug(f"Cache Parameters: {cache_params}")
         session_class = CachedLimiterSession if rate_limit_params else CachedSession
-        return session_class(**rate_limit_params, **cache_params)
+        return _mount_pooled_adapter(session_class(**rate_limit_params, **cache_params))
 
     if rate_limit_params:
         if log_config:
             logger.debug(f"Rate Limit Parameters: {rate_limit_params}")
-        return LimiterSession(**rate_limit_params)
+        return _mount_pooled_adapter(LimiterSession(**rate_limit_params))
+
+    return _mount_pooled_adapter(Session())
 
-    return Session()
+
+def _mount_pooled_adapter(session: Session) -> Session:
+    """
+    Mount a keep-alive connection pool large enough for concurrent callers sharing the session,
+    retrying failed connection attempts so a dropped pooled connection doesn't fail the request.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(total=3, read=False, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def get_rate_limit_params(
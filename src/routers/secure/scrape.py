@@ -219,12 +219,9 @@ def scrape_item(request: Request, id: str) -> ScrapeItemResponse:
                 .scalar_one_or_none()
             )
         streams = scraper.scrape(item)
-        stream_containers = downloader.get_instant_availability([stream for stream in streams.keys()])
+        cached_hashes = downloader.get_cached_hashes(list(streams.keys()))
         for stream in streams.keys():
-            if len(stream_containers.get(stream, [])) > 0:
-                streams[stream].is_cached = True
-            else:
-                streams[stream].is_cached = False
+            streams[stream].is_cached = stream in cached_hashes
         log_string = item.log_string
 
     return {
@@ -2,6 +2,7 @@ from types import SimpleNamespace
 
 from program.media.item import Episode, Movie, Season, Show
 from program.services.downloaders.realdebrid import RealDebridDownloader
+from program.services.downloaders.shared import FileFinder
 
 realdebrid_downloader = RealDebridDownloader()
 
@@ -75,4 +76,18 @@ def test_matches_item_no_selected_files():
         ]
     )
     item = Movie({"imdb_id": "tt1375666", "requested_by": "user", "title": "Inception"})
-    assert realdebrid_downloader._matches_item(torrent_info, item) is False
\ No newline at end of file
+    assert realdebrid_downloader._matches_item(torrent_info, item) is False
+
+def test_group_by_episode():
+    file_finder = FileFinder("filename", "filesize")
+    container = {
+        "1": {"filename": "The Vampire Diaries s01e01.mkv", "filesize": 800_000_000},
+        "2": {"filename": "The Vampire Diaries s01e02e03.mkv", "filesize": 800_000_000},
+        "3": {"filename": "Extras.mkv", "filesize": 800_000_000},
+    }
+    files_by_episode = file_finder.group_by_episode(container)
+    assert files_by_episode == {
+        (1, 1): container["1"],
+        (1, 2): container["2"],
+        (1, 3): container["2"],
+    }
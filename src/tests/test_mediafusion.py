@@ -0,0 +1,58 @@
+import pytest
+import responses
+
+from program.media.item import Movie
+from program.services.scrapers.mediafusion import Mediafusion
+from program.settings.manager import settings_manager as settings
+
+STREAM_URL = f"{settings.settings.scraping.mediafusion.url}/encrypted/stream/movie/tt1375666.json"
+
+
+def _hash(index: int) -> str:
+    return f"{index:040x}"
+
+
+def _stream(description: str, url: str) -> dict:
+    return {"name": "MediaFusion", "description": description, "url": url}
+
+
+@pytest.fixture
+def mediafusion(monkeypatch):
+    """Instance of Mediafusion that skips the user data encryption on startup"""
+    monkeypatch.setattr(Mediafusion, "validate", lambda self: True)
+    mediafusion = Mediafusion()
+    mediafusion.encrypted_string = "encrypted"
+    return mediafusion
+
+
+@pytest.fixture
+def movie():
+    return Movie({"imdb_id": "tt1375666", "title": "Inception"})
+
+
+@responses.activate
+def test_scrape_parses_titles_and_hashes(mediafusion, movie):
+    responses.add(responses.GET, STREAM_URL, json={"streams": [
+        _stream("📂 Inception.2010.1080p.BluRay.x264\n💾 1.2 GB 👤 10", f"https://mf.test/playback?info_hash={_hash(1)}"),
+        _stream("Inception 📂 2010 2160p\n💾 4.5 GB", f"https://mf.test/playback?info_hash={_hash(2)}&season=1#top"),
+        _stream("Inception.2010.720p without size", f"https://mf.test/playback?info_hash={_hash(3)}"),
+        _stream("📂 Inception.2010.480p\n💾 700 MB", "https://mf.test/playback"),
+        _stream("📂 \n💾 700 MB", f"https://mf.test/playback?info_hash={_hash(4)}"),
+    ]})
+    assert mediafusion.scrape(movie) == {
+        _hash(1): "Inception.2010.1080p.BluRay.x264",
+        _hash(2): "Inception 📂 2010 2160p",
+    }
+
+
+@responses.activate
+def test_scrape_stops_at_max_streams(mediafusion, movie, monkeypatch):
+    monkeypatch.setattr(mediafusion.settings, "max_streams", 2)
+    responses.add(responses.GET, STREAM_URL, json={"streams": [
+        _stream(f"📂 Inception.2010.{i}.1080p\n💾 1.2 GB", f"https://mf.test/playback?info_hash={_hash(i)}")
+        for i in range(5)
+    ]})
+    assert mediafusion.scrape(movie) == {
+        _hash(0): "Inception.2010.0.1080p",
+        _hash(1): "Inception.2010.1.1080p",
+    }
@@ -0,0 +1,136 @@
+import json
+import re
+
+import pytest
+import responses
+
+from program.services.downloaders import Downloader
+from program.services.downloaders.realdebrid import RealDebridAPI, RealDebridDownloader, RealDebridError, RealDebridRequestHandler
+from program.settings.manager import settings_manager as settings
+from program.utils.request import HttpMethod, RateLimitExceeded, create_service_session
+
+BASE_URL = RealDebridAPI.BASE_URL
+AVAILABILITY_URL = re.compile(rf"{re.escape(BASE_URL)}/torrents/instantAvailability/.*")
+
+
+def _hash(index: int) -> str:
+    return f"{index:040x}"
+
+
+def _availability_callback(request):
+    """Report every requested hash as cached with a single mkv file"""
+    infohashes = request.url.rsplit("instantAvailability/", 1)[1].split("/")
+    body = {
+        infohash: {"rd": [{"1": {"filename": f"{infohash}.mkv", "filesize": 1_000_000_000}}]}
+        for infohash in infohashes
+    }
+    return 200, {"Content-Type": "application/json"}, json.dumps(body)
+
+
+@pytest.fixture
+def rsps():
+    """Mocked Real-Debrid API answering the user and instant availability endpoints"""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, f"{BASE_URL}/user", json={"premium": 1, "expiration": "2099-01-01T00:00:00.000Z"})
+        rsps.add_callback(responses.GET, AVAILABILITY_URL, callback=_availability_callback)
+        yield rsps
+
+
+@pytest.fixture
+def downloader(rsps):
+    """Instance of RealDebridDownloader backed by the mocked API"""
+    realdebrid_settings = settings.settings.downloaders.real_debrid
+    realdebrid_settings.enabled = True
+    realdebrid_settings.api_key = "key"
+    downloader = RealDebridDownloader()
+    assert downloader.initialized
+    yield downloader
+    realdebrid_settings.enabled = False
+    realdebrid_settings.api_key = ""
+
+
+def test_get_instant_availability_single_request(downloader, rsps):
+    infohashes = [_hash(i) for i in range(5)]
+    availability = downloader.get_instant_availability(infohashes)
+    assert set(availability) == set(infohashes)
+    assert len([call for call in rsps.calls if "instantAvailability" in call.request.url]) == 1
+
+
+def test_get_instant_availability_chunks_large_batches(downloader, rsps):
+    infohashes = [_hash(i) for i in range(RealDebridDownloader.MAX_HASHES_PER_REQUEST * 2 + 1)]
+    availability = downloader.get_instant_availability(infohashes)
+    assert set(availability) == set(infohashes)
+    assert len([call for call in rsps.calls if "instantAvailability" in call.request.url]) == 3
+
+
+def test_wait_for_files_polls_magnet_conversion(downloader, rsps):
+    url = f"{BASE_URL}/torrents/info/ABC"
+    rsps.add(responses.GET, url, json={"id": "ABC", "status": "magnet_conversion", "files": []})
+    rsps.add(responses.GET, url, json={"id": "ABC", "status": "waiting_files_selection", "files": [{"id": 1}]})
+    info = downloader.wait_for_files("ABC")
+    assert info["status"] == "waiting_files_selection"
+    assert len([call for call in rsps.calls if call.request.url == url]) == 2
+
+
+def test_get_torrent_info_is_a_single_request(downloader, rsps):
+    url = f"{BASE_URL}/torrents/info/ABC"
+    rsps.add(responses.GET, url, json={"id": "ABC", "status": "magnet_conversion", "files": []})
+    info = downloader.get_torrent_info("ABC")
+    assert info["status"] == "magnet_conversion"
+    assert len([call for call in rsps.calls if call.request.url == url]) == 1
+
+
+def test_get_instant_availability_is_cached(downloader, rsps):
+    infohashes = [_hash(i) for i in range(3)]
+    downloader.get_instant_availability(infohashes)
+    availability = downloader.get_instant_availability(infohashes + [_hash(3)])
+    assert set(availability) == set(infohashes + [_hash(3)])
+    availability_calls = [call for call in rsps.calls if "instantAvailability" in call.request.url]
+    assert len(availability_calls) == 2
+    assert availability_calls[1].request.url.endswith(_hash(3))
+    assert downloader.get_instant_availability(infohashes) == {infohash: availability[infohash] for infohash in infohashes}
+
+
+@responses.activate
+def test_request_handler_retries_after_rate_limit():
+    url = f"{BASE_URL}/torrents/info/ABC"
+    responses.add(responses.GET, url, json={"error": "too_many_requests"}, status=429, headers={"Retry-After": "0"})
+    responses.add(responses.GET, url, json={"id": "ABC", "status": "downloaded"})
+    request_handler = RealDebridRequestHandler(create_service_session(), BASE_URL)
+    info = request_handler.execute(HttpMethod.GET, "torrents/info/ABC")
+    assert info["status"] == "downloaded"
+    assert len(responses.calls) == 2
+
+
+def test_get_instant_availability_caches_misses(downloader, rsps):
+    infohash = _hash(0)
+    url = f"{BASE_URL}/torrents/instantAvailability/{infohash}"
+    rsps.remove(responses.GET, AVAILABILITY_URL)
+    rsps.add(responses.GET, url, json={infohash: []})
+    assert downloader.get_instant_availability([infohash]) == {}
+    assert downloader.get_instant_availability([infohash]) == {}
+    assert len([call for call in rsps.calls if call.request.url == url]) == 1
+
+
+def test_get_instant_availability_raises_on_failure(downloader, rsps, monkeypatch):
+    monkeypatch.setattr(RealDebridDownloader, "RETRY_DELAY", 0)
+    rsps.remove(responses.GET, AVAILABILITY_URL)
+    rsps.add(responses.GET, AVAILABILITY_URL, json={"error": "unknown_ressource"}, status=503)
+    with pytest.raises(RealDebridError):
+        downloader.get_instant_availability([_hash(0)])
+
+
+def test_get_instant_availability_stops_on_rate_limit(downloader, rsps, monkeypatch):
+    monkeypatch.setattr(RealDebridRequestHandler, "MAX_RATE_LIMIT_RETRIES", 0)
+    rsps.remove(responses.GET, AVAILABILITY_URL)
+    rsps.add(responses.GET, AVAILABILITY_URL, json={"error": "too_many_requests"}, status=429)
+    with pytest.raises(RateLimitExceeded):
+        downloader.get_instant_availability([_hash(0)])
+    assert len([call for call in rsps.calls if "instantAvailability" in call.request.url]) == 1
+
+
+def test_get_cached_hashes_reports_nothing_cached_on_failure(downloader, rsps, monkeypatch):
+    monkeypatch.setattr(RealDebridDownloader, "RETRY_DELAY", 0)
+    rsps.remove(responses.GET, AVAILABILITY_URL)
+    rsps.add(responses.GET, AVAILABILITY_URL, json={"error": "unknown_ressource"}, status=503)
+    assert Downloader().get_cached_hashes([_hash(0)]) == set()